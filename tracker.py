@@ -6,24 +6,43 @@ Supports both manual execution and daemon mode with periodic checks
 """
 
 import subprocess
+import socket
+import hashlib
 import time
 import logging
 import os
 import sys
 import argparse
-import yaml
-import difflib
-import psutil
+import atexit
+import signal
 from datetime import datetime
 from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
 from typing import Dict, List, Tuple, Optional
 
-# Netmiko import with error handling
-try:
-    from netmiko import ConnectHandler
-    NETMIKO_AVAILABLE = True
-except ImportError:
-    NETMIKO_AVAILABLE = False
+# Heavy or optional dependencies (yaml, psutil, netmiko, pyroute2, difflib) are
+# imported lazily by the code paths that use them to keep startup fast
+
+# Names used by `ip route` for common rtnetlink protocol and scope values
+RT_PROTOS = {2: 'kernel', 3: 'boot', 4: 'static', 16: 'dhcp'}
+RT_SCOPES = {253: 'link', 254: 'host'}
+RT_TABLE_MAIN = 254
+RT_PROTO_BOOT = 3
+RTN_UNICAST = 1
+RT_TYPES = {
+    2: 'local', 3: 'broadcast', 4: 'anycast', 5: 'multicast', 6: 'blackhole',
+    7: 'unreachable', 8: 'prohibit', 9: 'throw', 10: 'nat',
+}
+
+# Log record layout and report separators
+LOG_FORMAT = '[%(asctime)s] %(message)s'
+LOG_DATEFMT = '%Y-%m-%d %H:%M:%S'
+SEP_EQ = "=" * 60
+SEP_DASH = "-" * 60
+
+# Units used by RouteTracker.format_bytes, one per power of 1024
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 
 class RouteTracker:
@@ -33,14 +52,40 @@ class RouteTracker:
         """Initialize the route tracker with configuration"""
         self.config = self.load_config(config_file)
         self.previous_routes = None
+        self._prev_hash = None
+        self._disk_hash = None
+        self._prev_parsed: Dict[Tuple[str, ...], str] = {}
+        self._conn = None
+        self._conn_opened_at = 0.0
+        # Lazily imported dependencies: None until tried, False if the import failed
+        self._connect_handler = None
+        self._iproute = None
+        self._psutil = None
+        self._check_timeout = self.config['monitoring']['check_timeout']
+        self._stats_config = self.config['statistics']
         self.setup_directories()
         self.setup_logging()
+        atexit.register(self.close_ssh_connection)
+
+        # Mode is fixed for the tracker's lifetime, so bind the route getter once;
+        # an invalid mode keeps check_routes(), which reports the error
+        route_getters = {'ssh': self.get_routes_ssh, 'local': self.get_routes_local}
+        if self.config['mode'] in route_getters:
+            self.check_routes = route_getters[self.config['mode']]
 
     def load_config(self, config_file: str) -> dict:
         """Load configuration from YAML file"""
+        import yaml
+
+        # Prefer the libyaml C parser; fall back to the pure-Python one
+        loader = getattr(yaml, 'CSafeLoader', None)
+        if loader is None:
+            print("Warning: libyaml not available, using the slower pure-Python YAML parser")
+            loader = yaml.SafeLoader
+
         try:
             with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=loader)
             return config
         except FileNotFoundError:
             print(f"Error: Config file '{config_file}' not found")
@@ -54,6 +99,11 @@ class RouteTracker:
         output_dir = self.config['logging']['output_dir']
         os.makedirs(output_dir, exist_ok=True)
 
+        if self.config['snapshot']['store_previous']:
+            snapshot_dir = os.path.dirname(self.config['snapshot']['snapshot_file'])
+            if snapshot_dir:
+                os.makedirs(snapshot_dir, exist_ok=True)
+
     def setup_logging(self):
         """Configure logging to .svc file with timestamps"""
         output_dir = self.config['logging']['output_dir']
@@ -63,34 +113,42 @@ class RouteTracker:
 
         self.log_file = os.path.join(output_dir, f'{prefix}_{timestamp}{log_ext}')
 
+        # One formatter shared by all handlers
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT)
+
         # Configure file logging
+        file_handler = logging.FileHandler(self.log_file)
+        file_handler.setFormatter(formatter)
         logging.basicConfig(
             level=logging.INFO,
-            format='[%(asctime)s] %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            handlers=[
-                logging.FileHandler(self.log_file),
-            ]
+            handlers=[file_handler]
         )
 
         # Add console handler if enabled
         if self.config['logging']['enable_console']:
             console = logging.StreamHandler()
             console.setLevel(logging.INFO)
-            formatter = logging.Formatter('[%(asctime)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
             console.setFormatter(formatter)
             logging.getLogger().addHandler(console)
 
-        logging.info("=" * 60)
-        logging.info("Routing Table Change Tracker Started")
-        logging.info(f"Mode: {self.config['mode']}")
-        logging.info(f"Log file: {self.log_file}")
-        logging.info("=" * 60)
+        logging.info("\n".join([
+            SEP_EQ,
+            "Routing Table Change Tracker Started",
+            f"Mode: {self.config['mode']}",
+            f"Log file: {self.log_file}",
+            SEP_EQ,
+        ]))
 
     def get_routes_ssh(self) -> Optional[str]:
         """Get routing table from router via SSH using Netmiko"""
-        if not NETMIKO_AVAILABLE:
-            logging.error("Netmiko not installed. Install with: pip install netmiko")
+        if self._connect_handler is None:
+            try:
+                from netmiko import ConnectHandler
+                self._connect_handler = ConnectHandler
+            except ImportError:
+                logging.error("Netmiko not installed. Install with: pip install netmiko")
+                self._connect_handler = False
+        if not self._connect_handler:
             return None
 
         ssh_config = self.config['ssh_config']
@@ -104,7 +162,7 @@ class RouteTracker:
             'host': ssh_config['host'],
             'port': ssh_config.get('port', 22),
             'username': ssh_config['username'],
-            'timeout': self.config['monitoring']['check_timeout'],
+            'timeout': self._check_timeout,
         }
 
         # Add password or key file
@@ -113,27 +171,142 @@ class RouteTracker:
         if 'key_file' in ssh_config:
             device['key_file'] = ssh_config['key_file']
 
-        try:
-            logging.info(f"Connecting to router {ssh_config['host']}...")
-            connection = ConnectHandler(**device)
+        # Get command from config
+        commands = ssh_config.get('commands', {})
+        command = commands.get('default', 'show ip route')
+
+        # Retry once on a fresh connection, but only if a kept-alive session failed
+        while True:
+            reused = False
+            try:
+                previous = self._conn
+                connection = self.get_ssh_connection(device)
+                reused = connection is previous
 
-            # Get command from config
-            commands = ssh_config.get('commands', {})
-            command = commands.get('default', 'show ip route')
+                logging.info(f"Executing command: {command}")
+                output = connection.send_command(command)
 
-            logging.info(f"Executing command: {command}")
-            output = connection.send_command(command)
-            connection.disconnect()
+                logging.info("Successfully retrieved routing table from router")
+                return output
 
-            logging.info("Successfully retrieved routing table from router")
-            return output
+            except Exception as e:
+                self.close_ssh_connection()
+                if reused:
+                    logging.warning(f"SSH command failed, reconnecting: {e}")
+                    continue
+                logging.error(f"SSH connection failed: {e}")
+                return None
+
+    def get_ssh_connection(self, device: dict):
+        """Return the persistent SSH connection, reconnecting when stale"""
+        max_age = self.config['ssh_config'].get('max_connection_age', 300)
+
+        if self._conn is not None:
+            if time.monotonic() - self._conn_opened_at > max_age or not self._conn.is_alive():
+                self.close_ssh_connection()
+
+        if self._conn is None:
+            logging.info(f"Connecting to router {device['host']}...")
+            self._conn = self._connect_handler(**device)
+            self._conn_opened_at = time.monotonic()
+
+        return self._conn
+
+    def close_ssh_connection(self):
+        """Disconnect the persistent SSH connection if one is open"""
+        if self._conn is None:
+            return
+        try:
+            self._conn.disconnect()
+        except Exception:
+            pass
+        finally:
+            self._conn = None
+
+    def get_routes_netlink(self) -> Optional[str]:
+        """Get local routing table directly from the kernel via rtnetlink"""
+        try:
+            with self._iproute() as ipr:
+                links = {link['index']: link.get_attr('IFLA_IFNAME') for link in ipr.get_links()}
+                routes = ipr.get_routes(family=socket.AF_INET)
+
+            lines = []
+            for route in routes:
+                table = route.get_attr('RTA_TABLE') or route['table']
+                if table != RT_TABLE_MAIN:
+                    continue
+
+                # Like `ip route`, prefix non-unicast routes with their type
+                rtype = route['type']
+                parts = [] if rtype == RTN_UNICAST else [RT_TYPES.get(rtype, str(rtype))]
+
+                dst = route.get_attr('RTA_DST')
+                dst_len = route['dst_len']
+                if dst is None:
+                    parts.append('default')
+                elif dst_len == 32:
+                    parts.append(dst)
+                else:
+                    parts.append(f"{dst}/{dst_len}")
+
+                gateway = route.get_attr('RTA_GATEWAY')
+                if gateway:
+                    parts.append(f"via {gateway}")
+
+                oif = route.get_attr('RTA_OIF')
+                if oif is not None:
+                    parts.append(f"dev {links.get(oif, oif)}")
+
+                # `ip route` omits the default 'boot' protocol
+                proto = route['proto']
+                if proto != RT_PROTO_BOOT:
+                    parts.append(f"proto {RT_PROTOS.get(proto, proto)}")
+
+                scope = route['scope']
+                if scope:
+                    parts.append(f"scope {RT_SCOPES.get(scope, scope)}")
+
+                prefsrc = route.get_attr('RTA_PREFSRC')
+                if prefsrc:
+                    parts.append(f"src {prefsrc}")
+
+                priority = route.get_attr('RTA_PRIORITY')
+                if priority is not None:
+                    parts.append(f"metric {priority}")
+
+                # ECMP next hops, kept on the route's line so each route stays one diffable line
+                for nexthop in route.get_attr('RTA_MULTIPATH') or ():
+                    parts.append('nexthop')
+                    nh_gateway = nexthop.get_attr('RTA_GATEWAY')
+                    if nh_gateway:
+                        parts.append(f"via {nh_gateway}")
+                    parts.append(f"dev {links.get(nexthop['oif'], nexthop['oif'])}")
+                    parts.append(f"weight {nexthop['hops'] + 1}")
+
+                lines.append(' '.join(parts))
+
+            # Sort for a deterministic snapshot independent of kernel dump order
+            lines.sort()
+            logging.info("Successfully retrieved local routing table via netlink")
+            return ''.join(f"{line}\n" for line in lines)
 
         except Exception as e:
-            logging.error(f"SSH connection failed: {e}")
+            logging.error(f"Error reading routing table via netlink: {e}")
             return None
 
     def get_routes_local(self) -> Optional[str]:
         """Get local routing table using ip route command"""
+        if self.config['local_config'].get('use_netlink', False):
+            if self._iproute is None:
+                try:
+                    from pyroute2 import IPRoute
+                    self._iproute = IPRoute
+                except ImportError:
+                    logging.warning("pyroute2 not installed, falling back to command. Install with: pip install pyroute2")
+                    self._iproute = False
+            if self._iproute:
+                return self.get_routes_netlink()
+
         command = self.config['local_config']['command']
 
         try:
@@ -141,7 +314,7 @@ class RouteTracker:
                 command.split(),
                 capture_output=True,
                 text=True,
-                timeout=self.config['monitoring']['check_timeout']
+                timeout=self._check_timeout
             )
 
             if result.returncode == 0:
@@ -153,7 +326,7 @@ class RouteTracker:
                 return None
 
         except subprocess.TimeoutExpired:
-            logging.error(f"Command timed out after {self.config['monitoring']['check_timeout']} seconds")
+            logging.error(f"Command timed out after {self._check_timeout} seconds")
             return None
         except Exception as e:
             logging.error(f"Error executing local command: {e}")
@@ -176,152 +349,215 @@ class RouteTracker:
         if not self.config['snapshot']['store_previous']:
             return None
 
+        # Reuse the in-memory copy kept from the previous check (daemon mode)
+        if self.previous_routes is not None:
+            return self.previous_routes
+
         snapshot_file = self.config['snapshot']['snapshot_file']
 
         if os.path.exists(snapshot_file):
             try:
                 with open(snapshot_file, 'r') as f:
-                    return f.read()
+                    data = f.read()
+                self.cache_snapshot(data)
+                self._disk_hash = self._prev_hash
+                return data
             except Exception as e:
                 logging.warning(f"Could not load previous snapshot: {e}")
                 return None
         return None
 
-    def save_snapshot(self, routes: str):
+    def save_snapshot(self, routes: str, routes_hash: Optional[bytes] = None,
+                      parsed_routes: Optional[Dict[Tuple[str, ...], str]] = None):
         """Save current routing table snapshot to file"""
         if not self.config['snapshot']['store_previous']:
             return
 
+        if routes_hash is None:
+            routes_hash = self.hash_routes(routes)
+
+        self.cache_snapshot(routes, routes_hash, parsed_routes)
+
+        # Snapshot on disk already matches - nothing to write
+        if routes_hash == self._disk_hash:
+            return
+
         snapshot_file = self.config['snapshot']['snapshot_file']
+        tmp_file = snapshot_file + '.tmp'
 
         try:
-            os.makedirs(os.path.dirname(snapshot_file), exist_ok=True)
-            with open(snapshot_file, 'w') as f:
+            # Write to a temporary file and rename so readers never see a partial snapshot
+            with open(tmp_file, 'w') as f:
                 f.write(routes)
+            os.replace(tmp_file, snapshot_file)
+            self._disk_hash = routes_hash
         except Exception as e:
             logging.warning(f"Could not save snapshot: {e}")
-
-    def compare_and_log_changes(self, previous: str, current: str):
-        """Compare two routing tables and log differences"""
-        if previous == current:
-            logging.info("No routing table changes detected")
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+    def cache_snapshot(self, routes: str, routes_hash: Optional[bytes] = None,
+                       parsed_routes: Optional[Dict[Tuple[str, ...], str]] = None):
+        """Keep a snapshot in memory along with its parsed routes"""
+        if routes_hash is not None and routes_hash == self._prev_hash:
             return
 
-        logging.info("Route change detected!")
-        logging.info("-" * 60)
+        self.previous_routes = routes
+        self._prev_hash = routes_hash or self.hash_routes(routes)
+        self._prev_parsed = parsed_routes if parsed_routes is not None else self.parse_routes(routes)
 
-        # Generate unified diff
-        previous_lines = previous.splitlines(keepends=True)
-        current_lines = current.splitlines(keepends=True)
+    @staticmethod
+    def hash_routes(routes: str) -> bytes:
+        """Return the SHA-256 digest of a routing table snapshot"""
+        return hashlib.sha256(routes.encode()).digest()
 
-        diff = difflib.unified_diff(
-            previous_lines,
-            current_lines,
-            fromfile='Previous Routes',
-            tofile='Current Routes',
-            lineterm=''
-        )
+    @staticmethod
+    def parse_route(line: str) -> Tuple[str, ...]:
+        """Split a routing table line into its fields, ignoring spacing differences"""
+        return tuple(line.split())
 
-        diff_output = list(diff)
+    @staticmethod
+    def parse_routes(routes: str) -> Dict[Tuple[str, ...], str]:
+        """Map each parsed route to its line text"""
+        parse_route = RouteTracker.parse_route
+        return {parse_route(line): line for line in routes.splitlines() if line.strip()}
 
-        if diff_output:
-            logging.info("Routing table diff:")
-            for line in diff_output:
-                logging.info(line.rstrip())
+    def compare_and_log_changes(self, prev_parsed: Dict[Tuple[str, ...], str],
+                                current: str) -> Dict[Tuple[str, ...], str]:
+        """Compare two routing tables, log differences and return the current parsed routes"""
+        curr_parsed = self.parse_routes(current)
 
-        logging.info("-" * 60)
+        # Set difference on the parsed routes; only the changed ones are resolved back to text
+        added = {curr_parsed[key] for key in curr_parsed.keys() - prev_parsed.keys()}
+        removed = {prev_parsed[key] for key in prev_parsed.keys() - curr_parsed.keys()}
 
-        # Log added and removed routes
-        previous_set = set(previous.splitlines())
-        current_set = set(current.splitlines())
+        if not (added or removed):
+            logging.info("No routing table changes detected")
+            return curr_parsed
 
-        added = current_set - previous_set
-        removed = previous_set - current_set
+        # Sort each change set once; both the diff and the listing reuse it
+        added_sorted = sorted(added)
+        removed_sorted = sorted(removed)
 
-        if added:
-            logging.info("Added routes:")
-            for route in sorted(added):
-                if route.strip():
-                    logging.info(f"  + {route}")
+        # Build the report and emit it as a single log record
+        lines = ["Route change detected!", SEP_DASH]
 
-        if removed:
-            logging.info("Removed routes:")
-            for route in sorted(removed):
-                if route.strip():
-                    logging.info(f"  - {route}")
+        # Optional line diff, limited to the changed routes rather than the full table
+        if self.config['logging'].get('emit_unified_diff', False):
+            import difflib
 
-        logging.info("=" * 60)
+            # Something changed, so the diff is never empty; consume it lazily
+            lines.append("Routing table diff:")
+            lines.extend(line.rstrip() for line in difflib.ndiff(removed_sorted, added_sorted))
+            lines.append(SEP_DASH)
+
+        # Log added and removed routes (blank lines were already dropped by parse_routes)
+        if added_sorted:
+            lines.append("Added routes:")
+            lines.extend(f"  + {route}" for route in added_sorted)
+
+        if removed_sorted:
+            lines.append("Removed routes:")
+            lines.extend(f"  - {route}" for route in removed_sorted)
+
+        lines.append(SEP_EQ)
+        logging.info("\n".join(lines))
+        return curr_parsed
 
     def collect_network_stats(self):
         """Collect and log network statistics using psutil"""
-        if not self.config['statistics']['enabled']:
+        stats_config = self._stats_config
+        if not stats_config['enabled']:
+            return
+
+        if self._psutil is None:
+            try:
+                import psutil
+                self._psutil = psutil
+            except ImportError:
+                logging.error("psutil not installed. Install with: pip install psutil")
+                self._psutil = False
+        if not self._psutil:
             return
+        psutil = self._psutil
 
-        logging.info("Network Statistics:")
-        logging.info("-" * 60)
+        # Build the report and emit it as a single log record
+        lines = ["Network Statistics:", SEP_DASH]
 
         try:
             # Network I/O counters
-            if self.config['statistics']['collect_traffic']:
+            if stats_config['collect_traffic']:
                 net_io = psutil.net_io_counters()
-                logging.info(f"Network Traffic:")
-                logging.info(f"  Bytes sent: {self.format_bytes(net_io.bytes_sent)}")
-                logging.info(f"  Bytes received: {self.format_bytes(net_io.bytes_recv)}")
-                logging.info(f"  Packets sent: {net_io.packets_sent:,}")
-                logging.info(f"  Packets received: {net_io.packets_recv:,}")
-                logging.info(f"  Errors in: {net_io.errin}, Errors out: {net_io.errout}")
-                logging.info(f"  Drops in: {net_io.dropin}, Drops out: {net_io.dropout}")
+                lines.append(f"Network Traffic:")
+                lines.append(f"  Bytes sent: {self.format_bytes(net_io.bytes_sent)}")
+                lines.append(f"  Bytes received: {self.format_bytes(net_io.bytes_recv)}")
+                lines.append(f"  Packets sent: {net_io.packets_sent:,}")
+                lines.append(f"  Packets received: {net_io.packets_recv:,}")
+                lines.append(f"  Errors in: {net_io.errin}, Errors out: {net_io.errout}")
+                lines.append(f"  Drops in: {net_io.dropin}, Drops out: {net_io.dropout}")
+
+            # Scan sockets once and share the result between connections and ports
+            need_conns = stats_config['collect_connections'] or stats_config['collect_ports']
+            connections = psutil.net_connections(kind='inet') if need_conns else ()
 
             # Active connections
-            if self.config['statistics']['collect_connections']:
-                connections = psutil.net_connections(kind='inet')
-                logging.info(f"\nActive Connections: {len(connections)}")
+            if stats_config['collect_connections']:
+                lines.append(f"\nActive Connections: {len(connections)}")
 
                 # Count by status
                 status_count = Counter(conn.status for conn in connections)
                 for status, count in status_count.most_common():
-                    logging.info(f"  {status}: {count}")
+                    lines.append(f"  {status}: {count}")
 
             # Top ports
-            if self.config['statistics']['collect_ports']:
-                local_ports = [conn.laddr.port for conn in connections if conn.laddr]
-                remote_ports = [conn.raddr.port for conn in connections if conn.raddr]
-
-                top_count = self.config['statistics']['top_ports_count']
+            if stats_config['collect_ports']:
+                local_ports = []
+                remote_ports = []
+                add_local, add_remote = local_ports.append, remote_ports.append
+                for conn in connections:
+                    if (laddr := conn.laddr):
+                        add_local(laddr.port)
+                    if (raddr := conn.raddr):
+                        add_remote(raddr.port)
+
+                top_count = stats_config['top_ports_count']
 
                 if local_ports:
-                    logging.info(f"\nTop {top_count} Local Ports:")
-                    for port, count in Counter(local_ports).most_common(top_count):
-                        logging.info(f"  Port {port}: {count} connections")
+                    lines.append(f"\nTop {top_count} Local Ports:")
+                    for port, count in nlargest(top_count, Counter(local_ports).items(), key=itemgetter(1)):
+                        lines.append(f"  Port {port}: {count} connections")
 
                 if remote_ports:
-                    logging.info(f"\nTop {top_count} Remote Ports:")
-                    for port, count in Counter(remote_ports).most_common(top_count):
-                        logging.info(f"  Port {port}: {count} connections")
+                    lines.append(f"\nTop {top_count} Remote Ports:")
+                    for port, count in nlargest(top_count, Counter(remote_ports).items(), key=itemgetter(1)):
+                        lines.append(f"  Port {port}: {count} connections")
 
             # Network interfaces
             if_addrs = psutil.net_if_addrs()
             if_stats = psutil.net_if_stats()
 
-            logging.info(f"\nNetwork Interfaces:")
+            lines.append(f"\nNetwork Interfaces:")
             for interface, stats in if_stats.items():
                 status = "UP" if stats.isup else "DOWN"
                 speed = f"{stats.speed} Mbps" if stats.speed > 0 else "Unknown"
-                logging.info(f"  {interface}: {status}, Speed: {speed}")
+                lines.append(f"  {interface}: {status}, Speed: {speed}")
 
         except Exception as e:
+            logging.info("\n".join(lines))
+            lines = []
             logging.error(f"Error collecting network statistics: {e}")
 
-        logging.info("=" * 60)
+        lines.append(SEP_EQ)
+        logging.info("\n".join(lines))
 
     @staticmethod
     def format_bytes(bytes_value: int) -> str:
         """Format bytes into human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.2f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.2f} PB"
+        # Pick the unit from the bit length instead of dividing in a loop
+        idx = min(len(BYTE_UNITS) - 1, max(0, (bytes_value.bit_length() - 1) // 10))
+        return f"{bytes_value / (1 << (idx * 10)):.2f} {BYTE_UNITS[idx]}"
 
     def log_changes(self, message: str):
         """Log a message with timestamp"""
@@ -340,19 +576,24 @@ class RouteTracker:
 
         # Load previous snapshot
         previous_routes = self.load_previous_snapshot()
+        current_hash = self.hash_routes(current_routes)
+        current_parsed = None
 
         if previous_routes is None:
             logging.info("No previous snapshot found - this is the first run")
             logging.info(f"Current routing table has {len(current_routes.splitlines())} entries")
+        elif current_hash == self._prev_hash:
+            # Identical snapshot - skip the diff entirely
+            logging.info("No routing table changes detected")
         else:
             # Compare and log changes
-            self.compare_and_log_changes(previous_routes, current_routes)
+            current_parsed = self.compare_and_log_changes(self._prev_parsed, current_routes)
 
         # Collect network statistics
         self.collect_network_stats()
 
         # Save current snapshot
-        self.save_snapshot(current_routes)
+        self.save_snapshot(current_routes, current_hash, current_parsed)
 
         logging.info("Route check completed")
         return True
@@ -365,15 +606,24 @@ class RouteTracker:
         logging.info(f"Starting periodic monitoring (interval: {interval} seconds)")
         logging.info("Press Ctrl+C to stop monitoring")
 
-        try:
-            # Run first check immediately
-            self.run_once()
+        # Treat SIGTERM (e.g. systemctl stop) like Ctrl+C
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
 
-            # Continue periodic checks
+        try:
+            # Schedule against a monotonic deadline so check duration doesn't cause drift;
+            # the first check runs immediately
+            deadline = time.monotonic()
             while True:
-                time.sleep(interval)
+                deadline += interval
                 self.run_once()
 
+                now = time.monotonic()
+                if now < deadline:
+                    time.sleep(deadline - now)
+                else:
+                    logging.warning(f"Route check overran interval by {now - deadline:.1f}s")
+                    deadline = now
+
         except KeyboardInterrupt:
             logging.info("Monitoring stopped by user")
             logging.info("Tracker shutdown complete")